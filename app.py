@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+import gzip
+import hashlib
 import math
+import os
 from pathlib import Path
 from typing import Dict, List, Mapping
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, field_validator
 
@@ -40,6 +46,10 @@ FACILITY_NAMES = {
     CRAFT_FACILITY: "Crafting queue",
 }
 
+# Bound once at module scope; the helpers below run for every profile and
+# component, so avoid the repeated attribute lookup on math.
+_isfinite = math.isfinite
+
 loader = RemoteDataLoader()
 localisation = Localization(loader.fetch_json("en"))
 progression = ProgressionRepository(
@@ -55,31 +65,41 @@ def _is_modelled(profile: ProductionProfile) -> bool:
     if profile.category not in MODELLED_CATEGORIES:
         return False
     for minutes in profile.facility_minutes.values():
-        if minutes and math.isfinite(minutes) and minutes > 0:
+        if minutes and _isfinite(minutes) and minutes > 0:
             return True
     return False
 
 
 MODELLED_PROFILES = [profile for profile in ALL_PROFILES if _is_modelled(profile)]
+MODELLED_PROFILES_SORTED = sorted(MODELLED_PROFILES, key=lambda profile: profile.name)
+ABILITIES_PAYLOAD = [
+    {
+        "id": ability_id,
+        "label": label,
+        "max_level": progression.max_level(ability_id),
+    }
+    for ability_id, label in ABILITY_LABELS.items()
+]
 
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 
+# The landing page never changes while the process runs, so read and
+# compress it once instead of stat()ing and re-reading per request.
+_INDEX_PATH = STATIC_DIR / "index.html"
+_INDEX_BYTES = _INDEX_PATH.read_bytes() if _INDEX_PATH.exists() else None
+_INDEX_GZIP = gzip.compress(_INDEX_BYTES, 9) if _INDEX_BYTES is not None else None
+
 app = FastAPI(title="Astralite Optimiser API")
+app.add_middleware(GZipMiddleware, minimum_size=500)
 if STATIC_DIR.exists():
     app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
-def _safe_minutes(value: float) -> float:
-    if value is None or not math.isfinite(value):
-        return 0.0
-    return float(value)
-
-
 def _minutes_map(source: Mapping[str, float]) -> Dict[str, float]:
     return {
-        facility: round(_safe_minutes(minutes), 4)
+        facility: round(minutes, 4)
         for facility, minutes in source.items()
-        if math.isfinite(minutes) and minutes > 0
+        if _isfinite(minutes) and minutes > 0
     }
 
 
@@ -100,7 +120,7 @@ def _profile_detail(profile: ProductionProfile) -> Dict[str, object]:
             detail["fry_id"] = growth.fry_id
     elif profile.category == "furniture":
         craft_minutes = profile.facility_minutes.get(CRAFT_FACILITY)
-        if craft_minutes and math.isfinite(craft_minutes):
+        if craft_minutes and _isfinite(craft_minutes):
             detail["craft_minutes"] = round(craft_minutes, 4)
     return detail
 
@@ -116,7 +136,7 @@ def _component_dict(component) -> Dict[str, object]:
         profile_item_id = profile.item_id
         category = profile.category
         for facility, minutes in profile.facility_minutes.items():
-            if not math.isfinite(minutes) or minutes <= 0:
+            if not _isfinite(minutes) or minutes <= 0:
                 continue
             per_unit_minutes[facility] = round(minutes, 4)
             total_minutes[facility] = round(minutes * component.quantity, 4)
@@ -149,6 +169,33 @@ def _profile_dict(profile: ProductionProfile) -> Dict[str, object]:
     }
 
 
+def _build_init_payload() -> Dict[str, object]:
+    """Assemble the ``/api/init`` payload.
+
+    Everything in it derives from module-level singletons, so it is a pure
+    function of startup state and only needs to run once.
+    """
+
+    # Encode each profile immediately and keep only the bytes: the
+    # intermediate dict graph for one profile becomes garbage right away
+    # instead of the whole catalog being held alive until the final dump.
+    items = [
+        orjson.Fragment(orjson.dumps(_profile_dict(profile)))
+        for profile in MODELLED_PROFILES_SORTED
+    ]
+    return {
+        "abilities": ABILITIES_PAYLOAD,
+        "base_weekly_limit": BASE_WEEKLY_LIMIT,
+        "facility_names": FACILITY_NAMES,
+        "items": items,
+        "modelled_categories": sorted(MODELLED_CATEGORIES),
+    }
+
+
+_INIT_BYTES = orjson.dumps(_build_init_payload())
+_INIT_ETAG = hashlib.blake2b(_INIT_BYTES, digest_size=8).hexdigest()
+
+
 class AbilityModel(BaseModel):
     id: int
     label: str
@@ -222,40 +269,40 @@ class OptimiseRequest(BaseModel):
 
 
 @app.get("/", include_in_schema=False)
-async def root() -> FileResponse:
-    index_path = STATIC_DIR / "index.html"
-    if not index_path.exists():
+async def root(request: Request) -> Response:
+    if _INDEX_BYTES is None:
         raise HTTPException(status_code=404, detail="Front-end not built yet")
-    return FileResponse(index_path)
-
-
-@app.get("/api/init", response_model=InitResponse)
-async def api_init() -> InitResponse:
-    abilities = [
-        AbilityModel(
-            id=ability_id,
-            label=label,
-            max_level=progression.max_level(ability_id),
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            _INDEX_GZIP,
+            media_type="text/html",
+            headers={
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+                "Cache-Control": "no-cache",
+            },
         )
-        for ability_id, label in ABILITY_LABELS.items()
-    ]
-    items = [
-        ProfileModel(**_profile_dict(profile))
-        for profile in sorted(MODELLED_PROFILES, key=lambda prof: prof.name)
-    ]
-    return InitResponse(
-        abilities=abilities,
-        base_weekly_limit=BASE_WEEKLY_LIMIT,
-        facility_names=FACILITY_NAMES,
-        items=items,
-        modelled_categories=sorted(MODELLED_CATEGORIES),
+    return Response(_INDEX_BYTES, media_type="text/html", headers={"Cache-Control": "no-cache"})
+
+
+@app.get("/api/init", response_model=InitResponse, response_class=ORJSONResponse)
+async def api_init(request: Request) -> Response:
+    # The payload is constant for the lifetime of the process, so serve the
+    # bytes encoded at import time verbatim; warm clients that present the
+    # matching ETag get an empty 304 instead.
+    if request.headers.get("if-none-match") == _INIT_ETAG:
+        return Response(status_code=304)
+    return Response(
+        content=_INIT_BYTES,
+        media_type="application/json",
+        headers={"ETag": _INIT_ETAG, "Cache-Control": "public, max-age=300"},
     )
 
 
 def _facility_payload(data: Mapping[str, float]) -> Dict[str, Dict[str, float]]:
     payload: Dict[str, Dict[str, float]] = {}
     for facility, minutes in data.items():
-        safe_minutes = _safe_minutes(minutes)
+        safe_minutes = float(minutes) if minutes is not None and _isfinite(minutes) else 0.0
         payload[facility] = {
             "minutes": round(safe_minutes, 4),
             "hours": round(safe_minutes / 60.0, 4),
@@ -263,11 +310,39 @@ def _facility_payload(data: Mapping[str, float]) -> Dict[str, Dict[str, float]]:
     return payload
 
 
-@app.post("/api/optimise", response_model=OptimiseResponse)
-async def api_optimise(payload: OptimiseRequest) -> OptimiseResponse:
+@functools.lru_cache(maxsize=4096)
+def _unlocked_profiles(levels_key: tuple) -> tuple:
+    """Profiles unlocked at the given (clamped) ability levels.
+
+    Only ~5 abilities with small level ranges exist, so the distinct keys
+    are few; memoising skips the per-request scan over MODELLED_PROFILES.
+    """
+
+    levels = dict(levels_key)
+    return tuple(
+        profile
+        for profile in MODELLED_PROFILES
+        if levels.get(profile.ability_id, 0) >= profile.ability_level
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _optimise_bytes(
+    requested_levels: tuple,
+    bonus_ids_key: tuple,
+    requested_slots: int,
+) -> bytes:
+    """Run the optimiser for a canonicalised request and encode the response.
+
+    The plan is a pure function of the request plus module-level game data,
+    and users re-submit identical slider settings constantly, so cache the
+    encoded bytes per canonical key.
+    """
+
+    requested_map = dict(requested_levels)
     ability_levels: Dict[int, int] = {}
     for ability_id in ABILITY_LABELS:
-        requested = payload.ability_levels.get(ability_id, 0)
+        requested = requested_map.get(ability_id, 0)
         max_level = progression.max_level(ability_id)
         if max_level:
             ability_levels[ability_id] = max(0, min(int(requested), max_level))
@@ -280,7 +355,7 @@ async def api_optimise(payload: OptimiseRequest) -> OptimiseResponse:
 
     plant_plots = progression.sum_item_counts(34, ability_levels.get(34, 0), FARMLAND_ITEMS)
     fish_ponds = progression.sum_item_counts(47, ability_levels.get(47, 0), FISH_POND_ITEMS)
-    crafting_slots = max(payload.crafting_slots, 1)
+    crafting_slots = max(requested_slots, 1)
 
     capacities = {
         PLANT_FACILITY: plant_plots * WEEK_MINUTES,
@@ -288,29 +363,36 @@ async def api_optimise(payload: OptimiseRequest) -> OptimiseResponse:
         CRAFT_FACILITY: crafting_slots * WEEK_MINUTES,
     }
 
-    unlocked_profiles = [
-        profile
-        for profile in MODELLED_PROFILES
-        if ability_levels.get(profile.ability_id, 0) >= profile.ability_level
-    ]
+    unlocked_profiles = _unlocked_profiles(tuple(sorted(ability_levels.items())))
 
-    bonus_ids = set(payload.bonus_item_ids[:4])
-    result = optimise_portfolio(unlocked_profiles, weekly_limit, capacities, bonus_ids)
-
-    plan_items = [
-        PlanItemModel(
-            item_id=item.item_id,
-            name=item.name,
-            category=item.profile.category,
-            units=round(item.units, 4),
-            astralite=round(item.astralite, 4),
-            multiplier=item.multiplier,
-            per_unit_value=round(item.profile.sale_value * item.multiplier, 4),
-            facility_minutes=_minutes_map(item.facility_minutes),
-            per_unit_facility_minutes=_minutes_map(item.profile.facility_minutes),
+    result = optimise_portfolio(
+        unlocked_profiles, weekly_limit, capacities, set(bonus_ids_key)
+    )
+
+    # The plan data was just produced by our own optimiser, so skip Pydantic
+    # validation with model_construct; the models remain for the OpenAPI docs.
+    # Hoisted locals keep the per-item bytecode tight for large plans.
+    plan_items: List[PlanItemModel] = []
+    append_plan = plan_items.append
+    construct_plan = PlanItemModel.model_construct
+    _round = round
+    _map = _minutes_map
+    for item in result.items:
+        profile = item.profile
+        multiplier = item.multiplier
+        append_plan(
+            construct_plan(
+                item_id=item.item_id,
+                name=item.name,
+                category=profile.category,
+                units=_round(item.units, 4),
+                astralite=_round(item.astralite, 4),
+                multiplier=multiplier,
+                per_unit_value=_round(profile.sale_value * multiplier, 4),
+                facility_minutes=_map(item.facility_minutes),
+                per_unit_facility_minutes=_map(profile.facility_minutes),
+            )
         )
-        for item in result.items
-    ]
 
     message: str | None = None
     if not plan_items:
@@ -322,7 +404,7 @@ async def api_optimise(payload: OptimiseRequest) -> OptimiseResponse:
     facility_usage = _facility_payload(result.facility_usage)
     capacities_payload = _facility_payload(capacities)
 
-    return OptimiseResponse(
+    response = OptimiseResponse.model_construct(
         status=result.status,
         weekly_limit=weekly_limit,
         weekly_bonus=weekly_bonus,
@@ -336,3 +418,31 @@ async def api_optimise(payload: OptimiseRequest) -> OptimiseResponse:
         unlocked_item_ids=[profile.item_id for profile in unlocked_profiles],
         message=message,
     )
+    return orjson.dumps(response.model_dump())
+
+
+@app.post("/api/optimise", response_model=OptimiseResponse, response_class=ORJSONResponse)
+def api_optimise(payload: OptimiseRequest) -> Response:
+    # Deliberately sync: the solve is CPU-bound, so Starlette runs it in its
+    # threadpool instead of stalling the event loop for every other request.
+    content = _optimise_bytes(
+        tuple(sorted(payload.ability_levels.items())),
+        tuple(sorted(set(payload.bonus_item_ids[:4]))),
+        payload.crafting_slots,
+    )
+    return Response(content=content, media_type="application/json")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools speed up event-loop scheduling and HTTP parsing
+    # for every request without touching any handler code.
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
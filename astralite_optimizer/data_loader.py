@@ -2,25 +2,58 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Tuple
 
+import msgpack
+import orjson
 import requests
 
 from .config import DATA_URLS
 
+CACHE_TTL_SECONDS = 60 * 60
+"""How long an on-disk dataset is trusted before revalidating with its ETag."""
+
 
 @dataclass(slots=True)
 class RemoteDataLoader:
-    """Fetches JSON blobs from the public Astralite data repository."""
+    """Fetches JSON blobs from the public Astralite data repository.
+
+    Parsed datasets are persisted to ``cache_dir`` as msgpack, so a restarted
+    process can skip the download and the JSON parse entirely. Entries older
+    than :data:`CACHE_TTL_SECONDS` are revalidated with a conditional request
+    using the stored ETag. The directory defaults to ``ASTRALITE_CACHE_DIR``
+    (point it at ``/dev/shm`` and prewarm it before forking workers so every
+    worker loads from the same in-memory files) and falls back to the system
+    temp directory. Returned datasets are read-only mapping proxies, so a
+    worker cannot accidentally mutate — and thereby privately copy — shared
+    data.
+    """
 
     session: requests.Session | None = None
     urls: Mapping[str, str] = field(default_factory=lambda: DATA_URLS.copy())
+    cache_dir: Path | None = None
     _session: requests.Session = field(init=False, repr=False)
     _cache: Dict[str, Any] = field(init=False, repr=False, default_factory=dict)
+    _cache_dir: Path = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._session = self.session or requests.Session()
+        self._cache_dir = Path(
+            self.cache_dir or os.environ.get("ASTRALITE_CACHE_DIR") or tempfile.gettempdir()
+        )
+
+    @property
+    def cache_directory(self) -> Path:
+        """Directory holding the on-disk dataset caches."""
+
+        return self._cache_dir
 
     def fetch_json(self, name: str) -> Any:
         """Return the parsed JSON for ``name`` from the configured URLs."""
@@ -28,12 +61,66 @@ class RemoteDataLoader:
         if name not in self.urls:
             raise KeyError(f"Unknown dataset: {name}")
         if name not in self._cache:
-            response = self._session.get(self.urls[name], timeout=30)
-            response.raise_for_status()
-            self._cache[name] = response.json()
+            data = self._load(name)
+            if type(data) is dict:
+                data = MappingProxyType(data)
+            self._cache[name] = data
         return self._cache[name]
 
+    def fetch_many(self, names: Iterable[str]) -> Dict[str, Any]:
+        """Fetch several datasets, downloading cache misses concurrently.
+
+        Cold starts are network-bound, so the misses go out in parallel on a
+        short-lived thread pool instead of one request at a time.
+        """
+
+        names = list(names)
+        missing = [name for name in dict.fromkeys(names) if name not in self._cache]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                # Consume the iterator so every download finishes (and any
+                # error surfaces) before the sequential cache fill below.
+                list(executor.map(self.fetch_json, missing))
+        return {name: self.fetch_json(name) for name in names}
+
+    def _cache_path(self, name: str) -> Path:
+        return self._cache_dir / f"astralite_{name}.msgpack"
+
+    def _load(self, name: str) -> Any:
+        path = self._cache_path(name)
+        etag, data = self._read_disk_cache(path)
+        if data is not None and time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+            return data
+
+        headers = {"If-None-Match": etag} if etag else None
+        response = self._session.get(self.urls[name], timeout=30, headers=headers)
+        if response.status_code == 304 and data is not None:
+            path.touch()
+            return data
+        response.raise_for_status()
+        # orjson parses the multi-megabyte blobs far faster than the
+        # stdlib json module used by response.json().
+        data = orjson.loads(response.content)
+        self._write_disk_cache(path, response.headers.get("ETag"), data)
+        return data
+
+    @staticmethod
+    def _read_disk_cache(path: Path) -> Tuple[str | None, Any]:
+        try:
+            payload = msgpack.unpackb(path.read_bytes(), raw=False)
+            return payload.get("etag"), payload.get("data")
+        except (OSError, ValueError, AttributeError):
+            return None, None
+
+    @staticmethod
+    def _write_disk_cache(path: Path, etag: str | None, data: Any) -> None:
+        try:
+            path.write_bytes(msgpack.packb({"etag": etag, "data": data}))
+        except OSError:
+            # A read-only cache directory just means we fall back to
+            # refetching on the next start.
+            pass
+
     # Convenience aliases for clarity when reading call sites.
     def __call__(self, name: str) -> Any:  # pragma: no cover - trivial alias
         return self.fetch_json(name)
-
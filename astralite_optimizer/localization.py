@@ -3,45 +3,69 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from types import MappingProxyType
 from typing import Any, Dict, Mapping
 
+import marisa_trie
+
 
 class Localization:
     """Provides convenient access to localisation keys.
 
     The supplied ``data`` is the parsed ``en.json`` blob.  The structure is
-    deeply nested, so we eagerly flatten all keys to enable efficient lookups
-    later in the optimiser.
+    deeply nested, so we eagerly flatten all keys, then pack them into a
+    marisa trie: the same lookups as a dict, at a fraction of the resident
+    memory of tens of thousands of small str objects.
     """
 
     def __init__(self, data: Mapping[str, Any]) -> None:
-        self._flat: Dict[str, str] = {}
-        self._flatten(data)
-
-    def _flatten(self, data: Any) -> None:
-        if isinstance(data, Mapping):
-            for key, value in data.items():
-                if isinstance(value, (Mapping, list)):
-                    self._flatten(value)
-                elif isinstance(value, str):
-                    self._flat[key] = value
-        elif isinstance(data, list):
-            for item in data:
-                self._flatten(item)
+        self._trie = marisa_trie.BytesTrie(
+            (key, value.encode("utf-8")) for key, value in self._flatten(data).items()
+        )
+
+    @staticmethod
+    def _flatten(data: Any) -> Dict[str, str]:
+        # Iterative traversal with concrete type checks: ``en.json`` is large
+        # and this runs at import time, so avoid recursion frames and the
+        # slower ABC isinstance checks on every node.
+        flat: Dict[str, str] = {}
+        stack = [data]
+        push = stack.append
+        while stack:
+            node = stack.pop()
+            kind = type(node)
+            # The loader hands the top-level blob out as a read-only proxy;
+            # everything nested below it is a plain dict or list.
+            if kind is dict or kind is MappingProxyType:
+                for key, value in node.items():
+                    kind = type(value)
+                    if kind is str:
+                        flat[key] = value
+                    elif kind is dict or kind is list:
+                        push(value)
+            elif type(node) is list:
+                for item in node:
+                    push(item)
+        return flat
 
     def get(self, key: str, default: str | None = None) -> str | None:
-        return self._flat.get(key, default)
+        values = self._trie.get(key)
+        return values[0].decode("utf-8") if values else default
 
     def item_name(self, item_id: int | str) -> str:
-        key = f"ItemName_{int(item_id)}"
-        return self._flat.get(key, f"Item {item_id}")
+        name = self.get(f"ItemName_{int(item_id)}")
+        return name if name is not None else f"Item {item_id}"
 
     def item_desc(self, item_id: int | str) -> str | None:
-        return self._flat.get(f"ItemDesc_{int(item_id)}")
+        return self.get(f"ItemDesc_{int(item_id)}")
 
     def ability_text(self, key: str) -> str | None:
-        return self._flat.get(key)
+        return self.get(key)
 
     def find_any(self, keys: Iterable[str]) -> Dict[str, str]:
-        return {key: self._flat[key] for key in keys if key in self._flat}
-
+        found: Dict[str, str] = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set
+from math import isfinite
+from typing import Dict, Iterable, List, Mapping, Sequence, Set
 
-from pulp import LpMaximize, LpProblem, LpStatus, LpVariable, PULP_CBC_CMD, lpSum
+import numpy as np
+from scipy.optimize import linprog
 
-from .production import ProductionProfile
+from .production import FACILITIES, ProductionProfile
+
+_FACILITY_INDEX = {facility: index for index, facility in enumerate(FACILITIES)}
+
+_LINPROG_METHOD = "highs-ds"
+"""HiGHS dual simplex: in-process, deterministic, and well suited to small LPs."""
+
+_STATUS_LABELS = {
+    0: "Optimal",
+    1: "Iteration limit reached",
+    2: "Infeasible",
+    3: "Unbounded",
+    4: "Numerical difficulties",
+}
 
 
 @dataclass(slots=True)
@@ -29,6 +44,124 @@ class OptimizationResult:
     status: str
 
 
+def _profile_row(profile: ProductionProfile) -> np.ndarray:
+    if profile.facility_row is not None:
+        return profile.facility_row
+    return np.array(
+        [profile.facility_minutes.get(facility, 0.0) for facility in FACILITIES],
+        dtype=np.float64,
+    )
+
+
+def _usage_dict(row: np.ndarray, units: float) -> Dict[str, float]:
+    """Expand a canonical facility row back into the named-usage mapping."""
+
+    return {
+        FACILITIES[index]: float(row[index]) * units
+        for index in range(len(FACILITIES))
+        if row[index] > 0
+    }
+
+
+def _build_result(
+    plan: Sequence[tuple],
+    capacities: Mapping[str, float],
+    status: str,
+) -> OptimizationResult:
+    """Assemble an :class:`OptimizationResult` from ``(profile, units, multiplier)`` rows."""
+
+    items: List[OptimizedItem] = []
+    facility_usage: Dict[str, float] = {facility: 0.0 for facility in capacities}
+    total_astralite = 0.0
+    for profile, units, multiplier in plan:
+        astralite = profile.sale_value * multiplier * units
+        usage = _usage_dict(_profile_row(profile), units)
+        for facility, amount in usage.items():
+            facility_usage[facility] = facility_usage.get(facility, 0.0) + amount
+        total_astralite += astralite
+        items.append(
+            OptimizedItem(
+                item_id=profile.item_id,
+                name=profile.name,
+                units=units,
+                astralite=astralite,
+                multiplier=multiplier,
+                facility_minutes=usage,
+                profile=profile,
+            )
+        )
+    items.sort(key=lambda item: item.astralite, reverse=True)
+    return OptimizationResult(
+        items=items,
+        total_astralite=total_astralite,
+        facility_usage=facility_usage,
+        status=status,
+    )
+
+
+def _saturate_weekly_cap(
+    ordered_profiles: Sequence[ProductionProfile],
+    values: np.ndarray,
+    multipliers: np.ndarray,
+    weekly_limit: float,
+    capacities: Mapping[str, float],
+) -> OptimizationResult | None:
+    """Greedy fast path for the degenerate case where the weekly cap binds.
+
+    The objective and the weekly-cap constraint share the same linear form, so
+    any feasible plan whose value reaches ``weekly_limit`` is optimal. When
+    the facility capacities are generous enough to get there with disjoint
+    single-facility items, the solver can be skipped entirely. Returns
+    ``None`` when the cap cannot be shown to be reachable this way.
+    """
+
+    constrained = [
+        facility for facility, capacity in capacities.items() if capacity is not None and capacity > 0
+    ]
+    plan: List[tuple] = []
+    remaining = weekly_limit
+
+    for position, profile in enumerate(ordered_profiles):
+        # An item that touches no constrained facility can saturate the cap
+        # on its own.
+        if all(profile.facility_minutes.get(facility, 0.0) <= 0 for facility in constrained):
+            units = remaining / float(values[position])
+            plan.append((profile, units, float(multipliers[position])))
+            return _build_result(plan, capacities, "Optimal")
+
+    for facility in constrained:
+        best_position = -1
+        best_density = 0.0
+        for position, profile in enumerate(ordered_profiles):
+            minutes_per_unit = profile.facility_minutes.get(facility, 0.0)
+            if minutes_per_unit <= 0 or not isfinite(minutes_per_unit):
+                continue
+            if any(
+                profile.facility_minutes.get(other, 0.0) > 0
+                for other in constrained
+                if other != facility
+            ):
+                continue
+            density = float(values[position]) / minutes_per_unit
+            if density > best_density:
+                best_density = density
+                best_position = position
+        if best_position < 0:
+            continue
+        profile = ordered_profiles[best_position]
+        achievable = capacities[facility] * best_density
+        take = min(remaining, achievable)
+        if take <= 0:
+            continue
+        units = take / float(values[best_position])
+        plan.append((profile, units, float(multipliers[best_position])))
+        remaining -= take
+        if remaining <= 1e-6:
+            return _build_result(plan, capacities, "Optimal")
+
+    return None
+
+
 def optimise_portfolio(
     profiles: Sequence[ProductionProfile],
     weekly_limit: float,
@@ -41,61 +174,68 @@ def optimise_portfolio(
         return OptimizationResult([], 0.0, {}, "No capacity")
 
     bonus_set: Set[int] = set(bonus_item_ids or [])
-    variables = {
-        profile.item_id: LpVariable(f"x_{profile.item_id}", lowBound=0)
-        for profile in profiles
-        if profile.sale_value > 0
-    }
-    if not variables:
+    ordered_profiles = [profile for profile in profiles if profile.sale_value > 0]
+    if not ordered_profiles:
         return OptimizationResult([], 0.0, {}, "No variables")
 
-    def item_multiplier(profile: ProductionProfile) -> float:
-        return 1.2 if profile.item_id in bonus_set else 1.0
+    multipliers = np.array(
+        [1.2 if profile.item_id in bonus_set else 1.0 for profile in ordered_profiles]
+    )
+    values = np.array([profile.sale_value for profile in ordered_profiles]) * multipliers
 
-    def item_value(profile: ProductionProfile) -> float:
-        return profile.sale_value * item_multiplier(profile)
+    fast_result = _saturate_weekly_cap(
+        ordered_profiles, values, multipliers, weekly_limit, capacities
+    )
+    if fast_result is not None:
+        return fast_result
 
-    ordered_profiles = [profile for profile in profiles if profile.item_id in variables]
-    problem = LpProblem("AstraliteOptimisation", LpMaximize)
-    problem += lpSum(item_value(profile) * variables[profile.item_id] for profile in ordered_profiles)
+    count = len(ordered_profiles)
+    minutes = np.empty((count, len(FACILITIES)), dtype=np.float64)
+    for position, profile in enumerate(ordered_profiles):
+        minutes[position] = _profile_row(profile)
 
-    # Facility capacity constraints
-    for facility, capacity in capacities.items():
-        if capacity is None or capacity <= 0:
-            continue
-        problem += (
-            lpSum(
-                profile.facility_minutes.get(facility, 0.0) * variables[profile.item_id]
-                for profile in ordered_profiles
-            )
-            <= capacity
-        )
+    # Facility capacity constraints plus the weekly Astralite cap, written
+    # directly into one preallocated coefficient matrix: no per-profile dict
+    # lookups and no intermediate row list to stack and copy.
+    constrained = [
+        (facility, capacity)
+        for facility, capacity in capacities.items()
+        if capacity is not None and capacity > 0
+    ]
+    coefficients = np.empty((len(constrained) + 1, count), dtype=np.float64)
+    bounds = np.empty(len(constrained) + 1, dtype=np.float64)
+    for row, (facility, capacity) in enumerate(constrained):
+        index = _FACILITY_INDEX.get(facility)
+        if index is not None:
+            coefficients[row] = minutes[:, index]
+        else:
+            coefficients[row] = [
+                profile.facility_minutes.get(facility, 0.0) for profile in ordered_profiles
+            ]
+        bounds[row] = capacity
+    coefficients[-1] = values
+    bounds[-1] = weekly_limit
 
-    # Weekly Astralite cap constraint
-    problem += (
-        lpSum(item_value(profile) * variables[profile.item_id] for profile in ordered_profiles)
-        <= weekly_limit
+    result = linprog(
+        -values,
+        A_ub=coefficients,
+        b_ub=bounds,
+        method=_LINPROG_METHOD,
     )
-
-    status_code = problem.solve(PULP_CBC_CMD(msg=False))
-    status = LpStatus.get(status_code, str(status_code))
+    status = _STATUS_LABELS.get(result.status, result.message)
 
     items: List[OptimizedItem] = []
     facility_usage: Dict[str, float] = {facility: 0.0 for facility in capacities}
     total_astralite = 0.0
 
-    if status_code in (1, "Optimal"):
-        for profile in ordered_profiles:
-            value = variables[profile.item_id].value() or 0.0
+    if result.status == 0:
+        for position, profile in enumerate(ordered_profiles):
+            value = float(result.x[position])
             if value <= 1e-6:
                 continue
-            multiplier = item_multiplier(profile)
-            astralite = item_value(profile) * value
-            usage = {
-                facility: minutes * value
-                for facility, minutes in profile.facility_minutes.items()
-                if minutes > 0
-            }
+            multiplier = float(multipliers[position])
+            astralite = float(values[position]) * value
+            usage = _usage_dict(minutes[position], value)
             for facility, amount in usage.items():
                 facility_usage[facility] = facility_usage.get(facility, 0.0) + amount
             total_astralite += astralite
@@ -115,4 +255,3 @@ def optimise_portfolio(
         facility_usage.clear()
 
     return OptimizationResult(items=items, total_astralite=total_astralite, facility_usage=facility_usage, status=status)
-
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import hashlib
 import math
-import re
+import pickle
+import sys
+from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional
 
+import numpy as np
+import orjson
+
 from .data_loader import RemoteDataLoader
 from .localization import Localization
 
@@ -17,14 +23,37 @@ ABILITY_CATEGORY = {
     47: "fish",
     48: "animal",
 }
-
-PLANT_FACILITY = "plant_plot"
-FISH_FACILITY = "fish_pond"
-CRAFT_FACILITY = "crafting"
+# One shared string object per category across every SaleItem and profile.
+_CATEGORY_INTERNED = {
+    ability_id: sys.intern(category) for ability_id, category in ABILITY_CATEGORY.items()
+}
+_OTHER_CATEGORY = sys.intern("other")
+
+# Interned so every profile's facility keys share one string object and
+# dict lookups on them short-circuit on identity.
+PLANT_FACILITY = sys.intern("plant_plot")
+FISH_FACILITY = sys.intern("fish_pond")
+CRAFT_FACILITY = sys.intern("crafting")
+FACILITIES = (PLANT_FACILITY, FISH_FACILITY, CRAFT_FACILITY)
+"""Canonical facility order for the per-profile coefficient rows."""
+_FACILITY_INDEX = {facility: index for index, facility in enumerate(FACILITIES)}
 WEEK_MINUTES = 7 * 24 * 60
 
+_CALCULATOR_CACHE_VERSION = 2
+"""Bump whenever the pickled calculator state changes shape."""
 
-@dataclass(slots=True)
+_CALCULATOR_DATASETS = (
+    "TbHomeProductsSaleInfo",
+    "TbPlantingGrowthProcess",
+    "TbPlantingNutrient",
+    "TbHomeFishGrowthConfig",
+    "TbHomeFishNutrientConfig",
+    "TbFurnitureTableMakeInfo",
+    "TbFurnitureMakeMaterialExchangeInfo",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class SaleItem:
     item_id: int
     ability_id: int
@@ -35,7 +64,13 @@ class SaleItem:
     category: str
 
 
-@dataclass(slots=True)
+# ``cycle_minutes`` and ``minutes_per_item`` are plain fields computed once at
+# load time: the instances never change after construction, and property
+# accessors would redo the divisions on every hit during profile assembly
+# (slots=True also rules out cached_property).
+
+
+@dataclass(frozen=True, slots=True)
 class PlantGrowth:
     seed_id: int
     harvest_item_id: int
@@ -43,45 +78,29 @@ class PlantGrowth:
     accelerated_time_sec: int
     average_yield: float
     farmland_ids: List[int]
+    cycle_minutes: float
+    minutes_per_item: float
 
-    @property
-    def cycle_minutes(self) -> float:
-        return self.accelerated_time_sec / 60.0
-
-    @property
-    def minutes_per_item(self) -> float:
-        if self.average_yield <= 0:
-            return math.inf
-        return self.cycle_minutes / self.average_yield
 
-
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class FishGrowth:
     fry_id: int
     fish_id: int
     growth_time_sec: int
     accelerated_time_sec: int
     name: str
+    cycle_minutes: float
+    minutes_per_item: float
     yield_per_cycle: float = 1.0
 
-    @property
-    def cycle_minutes(self) -> float:
-        return self.accelerated_time_sec / 60.0
 
-    @property
-    def minutes_per_item(self) -> float:
-        if self.yield_per_cycle <= 0:
-            return math.inf
-        return self.cycle_minutes / self.yield_per_cycle
-
-
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class MaterialRequirement:
     item_id: int
     quantity: float
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ComponentRequirement:
     item_id: int
     name: str
@@ -90,6 +109,7 @@ class ComponentRequirement:
     exchange_cost: Optional[int]
 
 
+# Left unfrozen: compute_profile attaches facility_row after construction.
 @dataclass(slots=True)
 class ProductionProfile:
     item_id: int
@@ -101,52 +121,152 @@ class ProductionProfile:
     facility_minutes: Dict[str, float]
     components: List[ComponentRequirement]
     notes: List[str]
+    facility_row: Optional[np.ndarray] = None
+    """Facility minutes aligned to :data:`FACILITIES`, for the optimiser."""
 
     def facility_summary(self) -> Dict[str, float]:
         return {k: round(v, 2) for k, v in self.facility_minutes.items() if v > 0}
 
 
-def _parse_numbers(text: str) -> List[float]:
-    numbers = re.findall(r"\d+(?:\.\d+)?", text or "")
-    return [float(value) for value in numbers]
-
-
 def _parse_average(text: str, fallback: float = 1.0) -> float:
-    numbers = _parse_numbers(text)
-    if not numbers:
+    """Average every number found in ``text`` (e.g. ``"2-3"`` -> 2.5).
+
+    The harvest-estimate strings are tiny and of known shape, so a direct
+    character scan beats spinning up the regex machinery per call.
+    """
+
+    total = 0.0
+    count = 0
+    int_part = 0
+    frac_part = 0
+    frac_scale = 1
+    in_number = False
+    in_fraction = False
+    for char in text or "":
+        if "0" <= char <= "9":
+            digit = ord(char) - 48
+            if not in_number:
+                in_number = True
+                in_fraction = False
+                int_part = 0
+                frac_part = 0
+                frac_scale = 1
+            if in_fraction:
+                frac_part = frac_part * 10 + digit
+                frac_scale *= 10
+            else:
+                int_part = int_part * 10 + digit
+        elif char == "." and in_number and not in_fraction:
+            in_fraction = True
+        elif in_number:
+            total += int_part + frac_part / frac_scale
+            count += 1
+            in_number = False
+            in_fraction = False
+    if in_number:
+        total += int_part + frac_part / frac_scale
+        count += 1
+    if not count:
         return fallback
-    return sum(numbers) / len(numbers)
+    return total / count
 
 
 class ProductionCalculator:
     """Builds production profiles for saleable items."""
 
+    # Everything derived purely from the datasets; what gets pickled.
+    _STATE_ATTRS = (
+        "sale_items",
+        "_name_by_id",
+        "plant_growth",
+        "fish_growth",
+        "furniture_recipes",
+        "_furniture_time",
+        "exchange_costs",
+    )
+
     def __init__(self, loader: RemoteDataLoader, localization: Localization) -> None:
         self._loader = loader
         self._localization = localization
-        self.sale_items = self._load_sale_items()
-        self.plant_growth = self._load_plant_growth()
-        self.fish_growth = self._load_fish_growth()
-        self.furniture_recipes = self._load_furniture_recipes()
-        self.exchange_costs = self._load_exchange_costs()
+        # Pull every dataset we need in one concurrent burst before the
+        # sequential load phase starts hitting them one by one.
+        loader.fetch_many(_CALCULATOR_DATASETS)
+        # The loaded mappings are a pure function of the source datasets, so a
+        # pickle keyed by their digest lets a restarted process skip the whole
+        # parse/join phase.
+        digest = self._source_digest()
+        cache_path = loader.cache_directory / "astralite_calculator.pkl"
+        if not self._restore(cache_path, digest):
+            self.sale_items = self._load_sale_items()
+            # Names were already resolved (trie lookup + decode) while loading
+            # the sale items; reuse them for component lookups instead of
+            # re-querying.
+            self._name_by_id: Dict[int, str] = {
+                item_id: sale.name for item_id, sale in self.sale_items.items()
+            }
+            self.plant_growth = self._load_plant_growth()
+            self.fish_growth = self._load_fish_growth()
+            self.furniture_recipes = self._load_furniture_recipes()
+            self.exchange_costs = self._load_exchange_costs()
+            self._persist(cache_path, digest)
         self._profile_cache: Dict[int, ProductionProfile] = {}
 
+    def _source_digest(self) -> str:
+        """Fingerprint of the source datasets (plus the pickle schema version)."""
+
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(str(_CALCULATOR_CACHE_VERSION).encode())
+        for name in _CALCULATOR_DATASETS:
+            data = self._loader.fetch_json(name)
+            if not isinstance(data, dict):
+                data = dict(data)
+            hasher.update(orjson.dumps(data, option=orjson.OPT_SORT_KEYS))
+        return hasher.hexdigest()
+
+    def _restore(self, path: Path, digest: str) -> bool:
+        try:
+            payload = pickle.loads(path.read_bytes())
+            if payload["digest"] != digest:
+                return False
+            state = payload["state"]
+            values = [state[attr] for attr in self._STATE_ATTRS]
+        except (OSError, KeyError, TypeError, pickle.UnpicklingError, EOFError, AttributeError):
+            # A stale or truncated pickle just means we rebuild from source.
+            return False
+        for attr, value in zip(self._STATE_ATTRS, values):
+            setattr(self, attr, value)
+        return True
+
+    def _persist(self, path: Path, digest: str) -> None:
+        payload = {
+            "digest": digest,
+            "state": {attr: getattr(self, attr) for attr in self._STATE_ATTRS},
+        }
+        try:
+            path.write_bytes(pickle.dumps(payload, protocol=5))
+        except OSError:
+            pass
+
     def _load_sale_items(self) -> Dict[int, SaleItem]:
         raw = self._loader.fetch_json("TbHomeProductsSaleInfo")
         sale_items: Dict[int, SaleItem] = {}
+        # Hoisted locals: this is the biggest of the startup loops.
+        _item_name = self._localization.item_name
+        _cat = _CATEGORY_INTERNED.get
+        _int = int
+        _float = float
         for entry in raw.values():
-            item_id = int(entry["item_id"])
-            ability_id = int(entry["ability_id"])
-            ability_level = int(entry.get("ability_level", 0))
-            ratio = float(entry.get("ratio", 0))
-            rewards = entry.get("rewards", []) or []
-            sale_value = sum(
-                float(reward.get("num", 0))
-                for reward in rewards
-                if int(reward.get("item_id", 0)) == 14
-            )
-            name = self._localization.item_name(item_id)
-            category = ABILITY_CATEGORY.get(ability_id, "other")
+            item_id = _int(entry["item_id"])
+            ability_id = _int(entry["ability_id"])
+            ability_level = _int(entry.get("ability_level", 0))
+            ratio = _float(entry.get("ratio", 0))
+            sale_value = 0.0
+            for reward in entry.get("rewards", []) or []:
+                # Astralite is item 14; skip the float() on everything else.
+                if _int(reward.get("item_id", 0)) == 14:
+                    sale_value += _float(reward.get("num", 0))
+            name = _item_name(item_id)
+            category = _cat(ability_id, _OTHER_CATEGORY)
             sale_items[item_id] = SaleItem(
                 item_id=item_id,
                 ability_id=ability_id,
@@ -176,6 +296,7 @@ class ProductionCalculator:
             accelerated = max(0, growth_time_sec - default_speedup)
             average_yield = _parse_average(entry.get("estimate_harvests", "1"), fallback=1.0)
             farmland_ids = [int(fid) for fid in entry.get("compatible_farmland", []) or []]
+            cycle_minutes = accelerated / 60.0
             plant_growth[harvest_item] = PlantGrowth(
                 seed_id=int(entry["seed"]),
                 harvest_item_id=harvest_item,
@@ -183,6 +304,8 @@ class ProductionCalculator:
                 accelerated_time_sec=accelerated,
                 average_yield=average_yield,
                 farmland_ids=farmland_ids,
+                cycle_minutes=cycle_minutes,
+                minutes_per_item=cycle_minutes / average_yield if average_yield > 0 else math.inf,
             )
         return plant_growth
 
@@ -194,78 +317,106 @@ class ProductionCalculator:
             if int(entry.get("consume_count", 0)) == 0:
                 default_speedup = int(entry.get("accelerate_time", 0))
                 break
+        # Hoisted locals: this runs over every fish entry at startup.
+        _int = int
+        _localise = self._localization.get
         fish_growth_by_name: Dict[str, FishGrowth] = {}
         for entry in growth_data.values():
-            fish_id = int(entry.get("fish_id", 0))
-            name = self._localization.get(f"FISH_{fish_id}")
+            fish_id = _int(entry.get("fish_id", 0))
+            name = _localise(f"FISH_{fish_id}")
             if not name:
                 continue
-            growth_time = int(entry.get("growth_time", 0))
+            growth_time = _int(entry.get("growth_time", 0))
             accelerated = max(0, growth_time - default_speedup)
+            cycle_minutes = accelerated / 60.0
             fish_growth_by_name[name.lower()] = FishGrowth(
-                fry_id=int(entry.get("fry_id", 0)),
+                fry_id=_int(entry.get("fry_id", 0)),
                 fish_id=fish_id,
                 growth_time_sec=growth_time,
                 accelerated_time_sec=accelerated,
                 name=name,
+                cycle_minutes=cycle_minutes,
+                minutes_per_item=cycle_minutes,
             )
-        # Map sale item IDs to growth data via the localised name.
-        fish_growth: Dict[int, FishGrowth] = {}
-        for sale in self.sale_items.values():
-            if sale.category != "fish":
-                continue
-            key = sale.name.lower()
-            if key in fish_growth_by_name:
-                fish_growth[sale.item_id] = fish_growth_by_name[key]
-        return fish_growth
+        # Join with the sale items on the lowercased localised name in one
+        # pass. (The sale rows carry no fish_id reference, so a name join is
+        # the only available key.)
+        lookup = fish_growth_by_name.get
+        return {
+            sale.item_id: growth
+            for sale in self.sale_items.values()
+            if sale.category == "fish" and (growth := lookup(sale.name.lower())) is not None
+        }
 
     def _load_furniture_recipes(self) -> Dict[int, List[MaterialRequirement]]:
         raw = self._loader.fetch_json("TbFurnitureTableMakeInfo")
         recipes: Dict[int, List[MaterialRequirement]] = {}
+        self._furniture_time: Dict[int, float] = {}
         for entry in raw.values():
             furniture_id = int(entry["furniture_id"])
-            materials = [
+            recipes[furniture_id] = [
                 MaterialRequirement(item_id=int(material["item_id"]), quantity=float(material.get("num", 0)))
                 for material in entry.get("material_consume", []) or []
             ]
-            time_minutes = float(entry.get("time", 0))
-            recipes[furniture_id] = materials
-            # We store craft time separately in a helper mapping.
-            entry["_time_minutes"] = time_minutes
-        self._furniture_time: Dict[int, float] = {
-            int(entry["furniture_id"]): float(entry.get("_time_minutes", 0))
-            for entry in raw.values()
-        }
+            self._furniture_time[furniture_id] = float(entry.get("time", 0))
         return recipes
 
     def _load_exchange_costs(self) -> Dict[int, int]:
         raw = self._loader.fetch_json("TbFurnitureMakeMaterialExchangeInfo")
         return {int(entry["material_item_id"]): int(entry.get("exchange_ratio", 0)) for entry in raw.values()}
 
+    # States for the explicit post-order traversal in compute_profile.
+    _ENTER = 0
+    _BUILD = 1
+
     def compute_profile(self, item_id: int) -> Optional[ProductionProfile]:
-        return self._compute_profile(item_id, stack=set())
-
-    def _compute_profile(self, item_id: int, stack: set[int]) -> Optional[ProductionProfile]:
-        if item_id in self._profile_cache:
-            return self._profile_cache[item_id]
-        if item_id in stack:
-            return None
-        sale = self.sale_items.get(item_id)
-        if not sale:
-            return None
-        stack.add(item_id)
+        """Build (and cache) the production profile for ``item_id``.
+
+        Recipes are walked iteratively in post order: component profiles are
+        built and cached before their parents, avoiding Python call-frame
+        overhead and the recursion limit on deep furniture trees. Recipe
+        cycles are skipped via the ``visiting`` set, leaving the offending
+        component without a profile, as before.
+        """
+
+        cache = self._profile_cache
+        if item_id in cache:
+            return cache[item_id]
+        visiting: set[int] = set()
+        stack: List[tuple[int, int]] = [(item_id, self._ENTER)]
+        while stack:
+            current, state = stack.pop()
+            if state == self._ENTER:
+                if current in cache or current in visiting:
+                    continue
+                sale = self.sale_items.get(current)
+                if not sale:
+                    continue
+                visiting.add(current)
+                stack.append((current, self._BUILD))
+                if sale.category == "furniture":
+                    for requirement in self.furniture_recipes.get(current, []):
+                        child = requirement.item_id
+                        if child not in cache and child not in visiting:
+                            stack.append((child, self._ENTER))
+            else:
+                visiting.discard(current)
+                profile = self._build_profile(self.sale_items[current])
+                profile.facility_row = np.array(
+                    [profile.facility_minutes.get(facility, 0.0) for facility in FACILITIES],
+                    dtype=np.float64,
+                )
+                cache[current] = profile
+        return cache.get(item_id)
+
+    def _build_profile(self, sale: SaleItem) -> ProductionProfile:
         if sale.category == "plant":
-            profile = self._build_plant_profile(sale)
-        elif sale.category == "fish":
-            profile = self._build_fish_profile(sale)
-        elif sale.category == "furniture":
-            profile = self._build_furniture_profile(sale, stack)
-        else:
-            profile = self._build_basic_profile(sale)
-        stack.remove(item_id)
-        if profile:
-            self._profile_cache[item_id] = profile
-        return profile
+            return self._build_plant_profile(sale)
+        if sale.category == "fish":
+            return self._build_fish_profile(sale)
+        if sale.category == "furniture":
+            return self._build_furniture_profile(sale)
+        return self._build_basic_profile(sale)
 
     def _build_basic_profile(self, sale: SaleItem) -> ProductionProfile:
         notes = [f"Production data for {sale.category} items is not yet modelled."]
@@ -321,16 +472,24 @@ class ProductionCalculator:
             notes=notes,
         )
 
-    def _build_furniture_profile(self, sale: SaleItem, stack: set[int]) -> ProductionProfile:
+    def _build_furniture_profile(self, sale: SaleItem) -> ProductionProfile:
         materials = self.furniture_recipes.get(sale.item_id, [])
-        facility_minutes: Dict[str, float] = {CRAFT_FACILITY: self._furniture_time.get(sale.item_id, 0.0)}
+        # Accumulate into a fixed-index row aligned to FACILITIES — list
+        # indexing instead of hashing in the inner loop — and expand to the
+        # named mapping once at construction.
+        minutes_row = [0.0] * len(FACILITIES)
+        minutes_row[_FACILITY_INDEX[CRAFT_FACILITY]] = self._furniture_time.get(sale.item_id, 0.0)
         components: List[ComponentRequirement] = []
         notes: List[str] = []
         if not materials:
             notes.append("Furniture recipe not found in extracted data.")
         for requirement in materials:
-            component_profile = self._compute_profile(int(requirement.item_id), stack)
-            component_name = self._localization.item_name(requirement.item_id)
+            # Post-order traversal guarantees buildable components are already
+            # cached; anything absent is a non-sale item or part of a cycle.
+            component_profile = self._profile_cache.get(requirement.item_id)
+            component_name = self._name_by_id.get(requirement.item_id) or self._localization.item_name(
+                requirement.item_id
+            )
             exchange_cost = self.exchange_costs.get(requirement.item_id)
             components.append(
                 ComponentRequirement(
@@ -342,8 +501,25 @@ class ProductionCalculator:
                 )
             )
             if component_profile:
-                for facility, minutes in component_profile.facility_minutes.items():
-                    facility_minutes[facility] = facility_minutes.get(facility, 0.0) + minutes * requirement.quantity
+                child_row = component_profile.facility_row
+                if child_row is not None:
+                    # Children built through compute_profile carry their
+                    # canonical row already; a straight weighted add beats
+                    # re-walking the named mapping for every parent that
+                    # shares the component. tolist() keeps the accumulator
+                    # plain Python floats.
+                    quantity = requirement.quantity
+                    child_minutes = child_row.tolist()
+                    for index in range(len(minutes_row)):
+                        minutes_row[index] += child_minutes[index] * quantity
+                else:
+                    for facility, minutes in component_profile.facility_minutes.items():
+                        minutes_row[_FACILITY_INDEX[facility]] += minutes * requirement.quantity
+        facility_minutes = {
+            facility: minutes_row[index]
+            for index, facility in enumerate(FACILITIES)
+            if minutes_row[index] or facility == CRAFT_FACILITY
+        }
         return ProductionProfile(
             item_id=sale.item_id,
             name=sale.name,
@@ -356,9 +532,55 @@ class ProductionCalculator:
             notes=notes,
         )
 
-    def supported_profiles(self) -> List[ProductionProfile]:
+    def _topological_item_order(self) -> List[int]:
+        """Sale item ids ordered so components precede the furniture using them.
+
+        Kahn's algorithm over the recipe graph; items caught in a recipe
+        cycle are appended afterwards in input order.
+        """
+
+        indegree: Dict[int, int] = {item_id: 0 for item_id in self.sale_items}
+        dependents: Dict[int, List[int]] = {}
+        for parent in self.sale_items:
+            for requirement in self.furniture_recipes.get(parent, []):
+                child = requirement.item_id
+                if child in indegree and child != parent:
+                    indegree[parent] += 1
+                    dependents.setdefault(child, []).append(parent)
+        ready = [item_id for item_id, degree in indegree.items() if degree == 0]
+        order: List[int] = []
+        while ready:
+            item_id = ready.pop()
+            order.append(item_id)
+            for parent in dependents.get(item_id, ()):
+                indegree[parent] -= 1
+                if indegree[parent] == 0:
+                    ready.append(parent)
+        if len(order) < len(indegree):
+            built = set(order)
+            order.extend(item_id for item_id in self.sale_items if item_id not in built)
+        return order
+
+    def supported_profiles(
+        self, categories: Optional[Iterable[str]] = None
+    ) -> List[ProductionProfile]:
+        """Profiles for the requested ``categories`` (actionable ones by default).
+
+        Items in unmodelled categories (``"other"``, ``"meteor"``, ...) would
+        only yield empty basic profiles, so they are skipped before any
+        traversal work happens. Components of requested furniture are still
+        built (and cached) as usual, whatever their category.
+        """
+
+        wanted = frozenset(categories if categories is not None else ("plant", "fish", "furniture"))
+        # Leaf-first order means every compute_profile call past the leaves is
+        # pure cache assembly: each profile is built exactly once and no
+        # traversal ever descends more than one level.
+        sale_items = self.sale_items
         profiles: List[ProductionProfile] = []
-        for item_id in self.sale_items:
+        for item_id in self._topological_item_order():
+            if sale_items[item_id].category not in wanted:
+                continue
             profile = self.compute_profile(item_id)
             if profile:
                 profiles.append(profile)
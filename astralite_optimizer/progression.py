@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Mapping
 
+import numpy as np
+
 
 @dataclass(slots=True)
 class LevelReward:
@@ -32,49 +36,110 @@ class ProgressionRepository:
             raw_id = int(entry["id"])
             ability_id = raw_id // 1000
             level = raw_id % 1000
-            items: Dict[int, int] = {}
+            items: Dict[int, int] = defaultdict(int)
             for reward in entry.get("des_item", []) or []:
                 item_id = int(reward.get("item_id", 0))
                 if not item_id:
                     continue
-                items[item_id] = items.get(item_id, 0) + int(reward.get("num", 0))
+                items[item_id] += int(reward.get("num", 0))
             self._rewards_by_ability.setdefault(ability_id, []).append(
-                LevelReward(ability_id=ability_id, level=level, items=items)
+                LevelReward(ability_id=ability_id, level=level, items=dict(items))
             )
 
         for rewards in self._rewards_by_ability.values():
             rewards.sort(key=lambda reward: reward.level)
 
+        # Prefix-sum snapshots per ability: element i holds the cumulative
+        # item totals through the i-th reward level, so a query is a bisect
+        # plus a dict lookup instead of a rescan of every reward.
+        self._cum_levels: Dict[int, List[int]] = {}
+        self._cum_totals: Dict[int, List[Dict[int, int]]] = {}
+        for ability_id, rewards in self._rewards_by_ability.items():
+            running: Dict[int, int] = {}
+            snapshots: List[Dict[int, int]] = []
+            for reward in rewards:
+                running = dict(running)
+                for item_id, qty in reward.items.items():
+                    running[item_id] = running.get(item_id, 0) + qty
+                snapshots.append(running)
+            self._cum_levels[ability_id] = [reward.level for reward in rewards]
+            self._cum_totals[ability_id] = snapshots
+
+        # Dense cumulative table per ability (row = level, column = item), so
+        # hot sum_item_counts queries reduce to an indexed C-level sum.
+        all_item_ids = sorted(
+            {
+                item_id
+                for rewards in self._rewards_by_ability.values()
+                for reward in rewards
+                for item_id in reward.items
+            }
+        )
+        self._item_index: Dict[int, int] = {
+            item_id: column for column, item_id in enumerate(all_item_ids)
+        }
+        self._level_cum: Dict[int, np.ndarray] = {}
+        item_index = self._item_index
+        for ability_id, rewards in self._rewards_by_ability.items():
+            table = np.zeros((rewards[-1].level + 1, len(all_item_ids)), dtype=np.int32)
+            # Scatter all (level, column, qty) triples in one C-level call
+            # instead of one indexed Python assignment per reward item.
+            triples = [
+                (reward.level, item_index[item_id], qty)
+                for reward in rewards
+                for item_id, qty in reward.items.items()
+            ]
+            if triples:
+                levels, columns, quantities = zip(*triples)
+                np.add.at(table, (np.array(levels), np.array(columns)), quantities)
+            np.cumsum(table, axis=0, out=table)
+            self._level_cum[ability_id] = table
+
         self._total_level_bonuses: List[TotalLevelBonus] = [
             TotalLevelBonus(level=int(entry["level"]), weekly_bonus=int(entry.get("gold_weekmax", 0)))
             for entry in total_level_data.values()
         ]
         self._total_level_bonuses.sort(key=lambda bonus: bonus.level)
+        # Parallel arrays over the sorted bonuses so lookups can bisect.
+        self._total_level_levels: List[int] = [bonus.level for bonus in self._total_level_bonuses]
+        self._total_level_values: List[int] = [
+            bonus.weekly_bonus for bonus in self._total_level_bonuses
+        ]
 
     def ability_reward_items(self, ability_id: int, level: int) -> Dict[int, int]:
-        """Return the cumulative item quantities unlocked up to ``level``."""
+        """Return the cumulative item quantities unlocked up to ``level``.
+
+        The returned mapping is a shared snapshot and must not be mutated.
+        """
 
-        totals: Dict[int, int] = {}
-        for reward in self._rewards_by_ability.get(ability_id, []):
-            if reward.level > level:
-                break
-            for item_id, qty in reward.items.items():
-                totals[item_id] = totals.get(item_id, 0) + qty
-        return totals
+        levels = self._cum_levels.get(ability_id)
+        if not levels:
+            return {}
+        index = bisect_right(levels, level) - 1
+        if index < 0:
+            return {}
+        return self._cum_totals[ability_id][index]
 
     def sum_item_counts(self, ability_id: int, level: int, item_ids: Iterable[int]) -> int:
-        reward_totals = self.ability_reward_items(ability_id, level)
-        return sum(reward_totals.get(item_id, 0) for item_id in item_ids)
+        table = self._level_cum.get(ability_id)
+        if table is None or level < 0:
+            return 0
+        row = table[min(level, len(table) - 1)]
+        # item_ids is tiny (typically four entries), so plain scalar adds beat
+        # materialising a column list and fancy-indexing a temporary array.
+        lookup = self._item_index.get
+        total = 0
+        for item_id in item_ids:
+            column = lookup(item_id)
+            if column is not None:
+                total += row[column]
+        return int(total)
 
     def max_level(self, ability_id: int) -> int:
         rewards = self._rewards_by_ability.get(ability_id, [])
         return rewards[-1].level if rewards else 0
 
     def weekly_bonus_for_total_level(self, total_level: int) -> int:
-        bonus = 0
-        for entry in self._total_level_bonuses:
-            if entry.level > total_level:
-                break
-            bonus = entry.weekly_bonus
-        return bonus
+        index = bisect_right(self._total_level_levels, total_level) - 1
+        return self._total_level_values[index] if index >= 0 else 0
 